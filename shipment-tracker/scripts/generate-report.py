@@ -4,95 +4,109 @@ Generate an interactive HTML shipment report from GitHub PR and issue data.
 Uses only Python standard library (no external dependencies).
 """
 
+import gzip
+import hashlib
+import heapq
+import http.server
+import itertools
 import json
+import math
+import mmap
+import os
+import random
+import re
+import shutil
+import struct
 import sys
+import tempfile
+import textwrap
+import time
+import urllib.parse
+import zlib
 import argparse
-from datetime import datetime
+import bisect
+import concurrent.futures
+from array import array
+from datetime import datetime, timedelta
 from collections import defaultdict
+from collections.abc import Sequence
 from html import escape
 
-HTML_TEMPLATE = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Shipment Report - {date_range}</title>
-    <style>
-        * {{
+REPORT_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
             line-height: 1.6;
             color: #24292f;
             background: #f6f8fa;
             padding: 20px;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             padding: 40px;
             border-radius: 6px;
             box-shadow: 0 1px 3px rgba(0,0,0,0.12);
-        }}
-        h1 {{
+        }
+        h1 {
             color: #24292f;
             margin-bottom: 10px;
             font-size: 32px;
-        }}
-        .subtitle {{
+        }
+        .subtitle {
             color: #57606a;
             margin-bottom: 30px;
             font-size: 16px;
-        }}
-        .summary {{
+        }
+        .summary {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 40px;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: #f6f8fa;
             padding: 20px;
             border-radius: 6px;
             border: 1px solid #d0d7de;
-        }}
-        .stat-value {{
+        }
+        .stat-value {
             font-size: 32px;
             font-weight: 600;
             color: #0969da;
             margin-bottom: 5px;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #57606a;
             font-size: 14px;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 40px;
-        }}
-        h2 {{
+        }
+        h2 {
             color: #24292f;
             font-size: 24px;
             margin-bottom: 20px;
             padding-bottom: 10px;
             border-bottom: 1px solid #d0d7de;
-        }}
-        .repo-section {{
+        }
+        .repo-section {
             margin-bottom: 30px;
-        }}
-        .repo-title {{
+        }
+        .repo-title {
             font-size: 20px;
             font-weight: 600;
             color: #0969da;
             margin-bottom: 15px;
-        }}
-        .items-list {{
+        }
+        .items-list {
             list-style: none;
-        }}
-        .item {{
+        }
+        .item {
             padding: 12px;
             margin-bottom: 8px;
             background: #f6f8fa;
@@ -101,55 +115,55 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             display: flex;
             justify-content: space-between;
             align-items: start;
-        }}
-        .item.pr {{
+        }
+        .item.pr {
             border-left-color: #8250df;
-        }}
-        .item.issue {{
+        }
+        .item.issue {
             border-left-color: #1a7f37;
-        }}
-        .item-main {{
+        }
+        .item-main {
             flex: 1;
-        }}
-        .item-title {{
+        }
+        .item-title {
             font-weight: 500;
             color: #24292f;
             margin-bottom: 4px;
-        }}
-        .item-title a {{
+        }
+        .item-title a {
             color: #0969da;
             text-decoration: none;
-        }}
-        .item-title a:hover {{
+        }
+        .item-title a:hover {
             text-decoration: underline;
-        }}
-        .item-meta {{
+        }
+        .item-meta {
             font-size: 13px;
             color: #57606a;
-        }}
-        .item-date {{
+        }
+        .item-date {
             font-size: 13px;
             color: #57606a;
             white-space: nowrap;
             margin-left: 20px;
-        }}
-        .badge {{
+        }
+        .badge {
             display: inline-block;
             padding: 2px 8px;
             font-size: 12px;
             font-weight: 500;
             border-radius: 12px;
             margin-right: 4px;
-        }}
-        .badge.pr {{
+        }
+        .badge.pr {
             background: #8250df;
             color: white;
-        }}
-        .badge.issue {{
+        }
+        .badge.issue {
             background: #1a7f37;
             color: white;
-        }}
-        .label-badge {{
+        }
+        .label-badge {
             display: inline-block;
             padding: 2px 8px;
             font-size: 11px;
@@ -157,58 +171,58 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             background: #ddf4ff;
             color: #0969da;
             margin-right: 4px;
-        }}
-        .category-summary {{
+        }
+        .category-summary {
             background: #f6f8fa;
             border: 1px solid #d0d7de;
             border-radius: 6px;
             padding: 20px;
             margin-bottom: 40px;
-        }}
-        .category-summary h3 {{
+        }
+        .category-summary h3 {
             color: #24292f;
             font-size: 18px;
             margin-bottom: 15px;
-        }}
-        .category-list {{
+        }
+        .category-list {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 15px;
-        }}
-        .category-item {{
+        }
+        .category-item {
             background: white;
             padding: 12px 15px;
             border-radius: 4px;
             border-left: 3px solid #0969da;
             font-size: 14px;
-        }}
-        .category-name {{
+        }
+        .category-name {
             font-weight: 600;
             color: #24292f;
             margin-bottom: 4px;
-        }}
-        .category-count {{
+        }
+        .category-count {
             color: #57606a;
             font-size: 13px;
-        }}
-        .timeline {{
+        }
+        .timeline {
             margin-bottom: 40px;
-        }}
-        .timeline-chart {{
+        }
+        .timeline-chart {
             height: 200px;
             background: #f6f8fa;
             border-radius: 6px;
             padding: 20px;
             position: relative;
             border: 1px solid #d0d7de;
-        }}
-        .timeline-bars {{
+        }
+        .timeline-bars {
             display: flex;
             height: 140px;
             align-items: flex-end;
             gap: 4px;
-        }}
-        .timeline-bar {{
+        }
+        .timeline-bar {
             flex: 1;
             background: linear-gradient(180deg, #8250df 0%, #0969da 100%);
             border-radius: 3px 3px 0 0;
@@ -216,11 +230,11 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             position: relative;
             cursor: pointer;
             transition: opacity 0.2s;
-        }}
-        .timeline-bar:hover {{
+        }
+        .timeline-bar:hover {
             opacity: 0.8;
-        }}
-        .timeline-bar-tooltip {{
+        }
+        .timeline-bar-tooltip {
             display: none;
             position: absolute;
             bottom: 100%;
@@ -233,53 +247,53 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             font-size: 12px;
             white-space: nowrap;
             margin-bottom: 5px;
-        }}
-        .timeline-bar:hover .timeline-bar-tooltip {{
+        }
+        .timeline-bar:hover .timeline-bar-tooltip {
             display: block;
-        }}
-        .filters {{
+        }
+        .filters {
             margin-bottom: 20px;
             padding: 15px;
             background: #f6f8fa;
             border-radius: 6px;
-        }}
-        .filter-group {{
+        }
+        .filter-group {
             display: inline-block;
             margin-right: 20px;
             margin-bottom: 10px;
-        }}
-        .filter-group label {{
+        }
+        .filter-group label {
             margin-right: 8px;
             font-size: 14px;
             color: #24292f;
-        }}
-        .filter-group select, .filter-group input {{
+        }
+        .filter-group select, .filter-group input {
             padding: 5px 10px;
             border: 1px solid #d0d7de;
             border-radius: 4px;
             font-size: 14px;
-        }}
-        .empty-state {{
+        }
+        .empty-state {
             text-align: center;
             padding: 40px;
             color: #57606a;
-        }}
-        .executive-summary {{
+        }
+        .executive-summary {
             background: white;
             border: 2px solid #0969da;
             border-radius: 6px;
             padding: 25px;
             margin-bottom: 40px;
-        }}
-        .executive-summary h3 {{
+        }
+        .executive-summary h3 {
             color: #0969da;
             font-size: 20px;
             margin-bottom: 15px;
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
-        .executive-summary-content {{
+        }
+        .executive-summary-content {
             background: #f6f8fa;
             padding: 20px;
             border-radius: 4px;
@@ -290,8 +304,8 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             color: #24292f;
             max-height: 400px;
             overflow-y: auto;
-        }}
-        .copy-button {{
+        }
+        .copy-button {
             background: #0969da;
             color: white;
             border: none;
@@ -300,22 +314,91 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             font-size: 14px;
             cursor: pointer;
             margin-top: 10px;
-        }}
-        .copy-button:hover {{
+        }
+        .copy-button:hover {
             background: #0860ca;
-        }}
-        .copy-button:active {{
+        }
+        .copy-button:active {
             background: #0757ba;
-        }}
-        @media (max-width: 768px) {{
-            .container {{
+        }
+        .metrics-table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 14px;
+            margin-bottom: 15px;
+        }
+        .metrics-table th, .metrics-table td {
+            padding: 8px 12px;
+            border-bottom: 1px solid #d0d7de;
+            text-align: right;
+        }
+        .metrics-table th:first-child, .metrics-table td:first-child {
+            text-align: left;
+        }
+        .metrics-table th {
+            background: #f6f8fa;
+            font-weight: 600;
+            color: #24292f;
+        }
+        .metrics-weekly summary {
+            cursor: pointer;
+            color: #0969da;
+            font-size: 14px;
+            margin-bottom: 10px;
+        }
+        @media (max-width: 768px) {
+            .container {
                 padding: 20px;
-            }}
-            .summary {{
+            }
+            .summary {
                 grid-template-columns: 1fr;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+REPORT_JS = """        function filterItems() {
+            const typeFilter = document.getElementById('typeFilter').value;
+            const repoFilter = document.getElementById('repoFilter').value;
+            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
+            
+            const items = document.querySelectorAll('.item');
+            items.forEach(item => {
+                const itemType = item.classList.contains('pr') ? 'pr' : 'issue';
+                const itemRepo = item.dataset.repo;
+                const itemTitle = item.querySelector('.item-title').textContent.toLowerCase();
+                
+                const typeMatch = typeFilter === 'all' || itemType === typeFilter;
+                const repoMatch = repoFilter === 'all' || itemRepo === repoFilter;
+                const searchMatch = searchTerm === '' || itemTitle.includes(searchTerm);
+                
+                if (typeMatch && repoMatch && searchMatch) {
+                    item.style.display = 'flex';
+                } else {
+                    item.style.display = 'none';
+                }
+            });
+        }
+        
+        function copyExecutiveSummary() {
+            const summaryText = document.getElementById('executiveSummaryText').textContent;
+            navigator.clipboard.writeText(summaryText).then(() => {
+                const button = document.getElementById('copyButton');
+                const originalText = button.textContent;
+                button.textContent = '✓ Copied!';
+                setTimeout(() => {
+                    button.textContent = originalText;
+                }, 2000);
+            });
+        }
+"""
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Shipment Report - {date_range}</title>
+    {head_assets}
 </head>
 <body>
     <div class="container">
@@ -354,6 +437,8 @@ HTML_TEMPLATE = """<!DOCTYPE html>
             </div>
         </div>
 
+        {cycle_time}
+
         <div class="section">
             <h2>🚀 Shipped Items</h2>
             <div class="filters">
@@ -384,42 +469,7 @@ HTML_TEMPLATE = """<!DOCTYPE html>
         </div>
     </div>
 
-    <script>
-        function filterItems() {{
-            const typeFilter = document.getElementById('typeFilter').value;
-            const repoFilter = document.getElementById('repoFilter').value;
-            const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-            
-            const items = document.querySelectorAll('.item');
-            items.forEach(item => {{
-                const itemType = item.classList.contains('pr') ? 'pr' : 'issue';
-                const itemRepo = item.dataset.repo;
-                const itemTitle = item.querySelector('.item-title').textContent.toLowerCase();
-                
-                const typeMatch = typeFilter === 'all' || itemType === typeFilter;
-                const repoMatch = repoFilter === 'all' || itemRepo === repoFilter;
-                const searchMatch = searchTerm === '' || itemTitle.includes(searchTerm);
-                
-                if (typeMatch && repoMatch && searchMatch) {{
-                    item.style.display = 'flex';
-                }} else {{
-                    item.style.display = 'none';
-                }}
-            }});
-        }}
-        
-        function copyExecutiveSummary() {{
-            const summaryText = document.getElementById('executiveSummaryText').textContent;
-            navigator.clipboard.writeText(summaryText).then(() => {{
-                const button = document.getElementById('copyButton');
-                const originalText = button.textContent;
-                button.textContent = '✓ Copied!';
-                setTimeout(() => {{
-                    button.textContent = originalText;
-                }}, 2000);
-            }});
-        }}
-    </script>
+    {body_assets}
 </body>
 </html>
 """
@@ -439,17 +489,8 @@ def format_date(date_str):
     return dt.strftime('%b %d, %Y')
 
 
-def generate_timeline_bars(items, since, until):
-    """Generate HTML for timeline bar chart."""
-    if not items:
-        return '<div class="empty-state">No data to display</div>'
-    
-    # Group items by date
-    date_counts = defaultdict(int)
-    for item in items:
-        date_key = item['date'][:10]  # YYYY-MM-DD
-        date_counts[date_key] += 1
-    
+def generate_timeline_bars(date_counts, since, until):
+    """Generate HTML for timeline bar chart from per-day (YYYY-MM-DD) item counts."""
     if not date_counts:
         return '<div class="empty-state">No data to display</div>'
     
@@ -497,22 +538,18 @@ def categorize_item(title, item_type):
             return 'Feature Requests & Enhancements'
 
 
-def generate_category_summary(all_items):
+def item_category(item):
+    """Category for an item, reusing one precomputed at load time if present."""
+    return item.get('category') or categorize_item(item['title'], item['type'])
+
+
+def generate_category_summary(category_counts):
     """Generate HTML for category summary section."""
-    if not all_items:
-        return ''
-    
-    # Categorize all items
-    categories = defaultdict(int)
-    for item in all_items:
-        category = categorize_item(item['title'], item['type'])
-        categories[category] += 1
-    
-    if not categories:
+    if not category_counts:
         return ''
     
     # Sort categories by count
-    sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)
+    sorted_categories = sorted(category_counts.items(), key=lambda x: x[1], reverse=True)
     
     html_parts = []
     html_parts.append('<div class="category-summary">')
@@ -533,45 +570,134 @@ def generate_category_summary(all_items):
     return ''.join(html_parts)
 
 
-def generate_executive_summary(all_items, repos, date_range, total_prs, total_issues, total_contributors):
-    """Generate executive summary text that can be copied."""
-    if not all_items:
-        return ''
+# Near-duplicate title clustering (MinHash + LSH). Signatures are 24 hash
+# minimums over a title's word set, split into 12 bands of 2, so titles with
+# Jaccard similarity of 0.5 share a band bucket ~97% of the time. A title
+# that isn't clustered yet joins the cluster of its bucket's first title only
+# if an exact Jaccard test on the (small) word sets passes against that
+# cluster's representative, so clusters never chain from one title to the
+# next and the pass stays linear in the number of titles rather than pairwise.
+MINHASH_BANDS = 12
+MINHASH_ROWS = 2
+# Modulus for the (a * x + b) % p permutations of crc32 word hashes
+MINHASH_PRIME = (1 << 31) - 1
+MINHASH_THRESHOLD = 0.5
+
+
+def title_shingles(title):
+    """Word set for similarity; numbers collapse so "Bump x to 1.2" ~ "Bump x to 1.3"."""
+    # Same Unicode-aware words as the server's title_tokens, so accented and non-Latin titles cluster too
+    return {re.sub(r'\d+', '#', token) for token in re.findall(r'\w+', title.lower())}
+
+
+def cluster_titles(titles, threshold=MINHASH_THRESHOLD):
+    """Group near-duplicate titles; returns index lists in order of first appearance."""
+    num_perm = MINHASH_BANDS * MINHASH_ROWS
+    # Fixed seed and crc32 (not hash()) keep clusters stable across runs
+    rng = random.Random(0)
+    coefficients = [(rng.randrange(1, MINHASH_PRIME), rng.randrange(MINHASH_PRIME)) for _ in range(num_perm)]
     
-    # Categorize all items
-    categories = defaultdict(list)
-    for item in all_items:
-        category = categorize_item(item['title'], item['type'])
-        categories[category].append(item)
+    # Titles share most of their words, so hash each distinct word only once
+    token_hashes = {}
     
-    # Identify customer-facing features (exclude internal/infra items)
-    def is_customer_facing(item):
-        title_lower = item['title'].lower()
-        
-        # Exclude internal infrastructure
-        if any(word in title_lower for word in ['chore:', 'chore ', 'test:', 'ci:', 'refactor:', 
-                                                  'deps:', 'bump', 'migrate', 'cleanup', 
-                                                  'internal', 'telemetry', 'logging']):
-            return False
-        
-        # Include clear customer features
-        if any(word in title_lower for word in ['skill', 'agent', 'tool', 'command', '/context', 
-                                                  '/compact', 'slash', 'model', 'auth', 'login',
-                                                  'handoff', 'continuity', 'resume', 'homebrew',
-                                                  'winget', 'install', 'tab completion', 'picker',
-                                                  'web fetch', 'github tool', 'mcp']):
-            return True
-        
-        # Include bug fixes
-        if item['type'] == 'PR' and any(word in title_lower for word in ['fix', 'bug', 'error']):
-            return True
-        
+    def token_vector(token):
+        vector = token_hashes.get(token)
+        if vector is None:
+            x = zlib.crc32(token.encode('utf-8'))
+            vector = token_hashes[token] = tuple((a * x + b) % MINHASH_PRIME for a, b in coefficients)
+        return vector
+    
+    shingle_sets = [title_shingles(title) for title in titles]
+    signatures = [tuple(map(min, zip(*map(token_vector, shingles)))) if shingles else None
+                  for shingles in shingle_sets]
+    
+    def similar(a, b):
+        return len(a & b) >= threshold * len(a | b)
+    
+    # Each title's representative: the earliest title of its cluster. Only
+    # singletons ever move, and always onto a representative, so no chains form.
+    representative = list(range(len(titles)))
+    has_members = [False] * len(titles)
+    
+    for band in range(MINHASH_BANDS):
+        lo, hi = band * MINHASH_ROWS, (band + 1) * MINHASH_ROWS
+        buckets = {}
+        for i, signature in enumerate(signatures):
+            if signature is None:
+                continue
+            head = buckets.setdefault(signature[lo:hi], i)
+            if head == i or representative[i] != i or has_members[i]:
+                continue
+            root = representative[head]
+            if similar(shingle_sets[root], shingle_sets[i]):
+                representative[i] = root
+                has_members[root] = True
+    
+    clusters = {}
+    for i, root in enumerate(representative):
+        clusters.setdefault(root, []).append(i)
+    assert all(similar(shingle_sets[root], shingle_sets[i]) for root, members in clusters.items() for i in members)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def is_customer_facing(item):
+    """Whether an item belongs in the executive summary's feature list."""
+    title_lower = item['title'].lower()
+    
+    # Exclude internal infrastructure
+    if any(word in title_lower for word in ['chore:', 'chore ', 'test:', 'ci:', 'refactor:', 
+                                              'deps:', 'bump', 'migrate', 'cleanup', 
+                                              'internal', 'telemetry', 'logging']):
         return False
     
-    customer_facing_items = [item for item in all_items if is_customer_facing(item)]
+    # Include clear customer features
+    if any(word in title_lower for word in ['skill', 'agent', 'tool', 'command', '/context', 
+                                              '/compact', 'slash', 'model', 'auth', 'login',
+                                              'handoff', 'continuity', 'resume', 'homebrew',
+                                              'winget', 'install', 'tab completion', 'picker',
+                                              'web fetch', 'github tool', 'mcp']):
+        return True
+    
+    # Include bug fixes
+    if item['type'] == 'PR' and any(word in title_lower for word in ['fix', 'bug', 'error']):
+        return True
+    
+    return False
+
+
+def feature_group(title):
+    """Executive summary group for a customer-facing item's title."""
+    title_lower = title.lower()
+    
+    if any(word in title_lower for word in ['skill', 'agent']):
+        return 'New Agent Skills & Capabilities'
+    elif any(word in title_lower for word in ['/context', '/compact', 'slash', 'command']):
+        return 'New Commands & Features'
+    elif any(word in title_lower for word in ['tool', 'mcp', 'github', 'web fetch']):
+        return 'Tool Integrations'
+    elif any(word in title_lower for word in ['model', 'picker', 'llm']):
+        return 'Model Management'
+    elif any(word in title_lower for word in ['auth', 'login', 'device code']):
+        return 'Authentication'
+    elif any(word in title_lower for word in ['handoff', 'continuity', 'resume', 'remote']):
+        return 'Cross-Platform Continuity'
+    elif any(word in title_lower for word in ['homebrew', 'winget', 'install', 'publish']):
+        return 'Distribution & Installation'
+    elif any(word in title_lower for word in ['ui', 'ux', 'display', 'tab completion']):
+        return 'User Experience Improvements'
+    elif any(word in title_lower for word in ['fix', 'bug', 'error']):
+        return 'Bug Fixes'
+    else:
+        return 'Other Features'
+
+
+def generate_executive_summary(summary, repos, date_range):
+    """Generate executive summary text that can be copied."""
+    if not summary.total_items:
+        return ''
     
     # Sort categories by count
-    sorted_categories = sorted(categories.items(), key=lambda x: len(x[1]), reverse=True)
+    sorted_categories = sorted(summary.category_counts.items(), key=lambda x: x[1], reverse=True)
     
     # Build text summary
     lines = []
@@ -579,40 +705,15 @@ def generate_executive_summary(all_items, repos, date_range, total_prs, total_is
     lines.append(f"Repositories: {', '.join(repos)}")
     lines.append("")
     lines.append("EXECUTIVE SUMMARY")
-    lines.append(f"• {len(customer_facing_items)} Customer-Facing Features Shipped")
-    lines.append(f"• {total_prs} Total Pull Requests Merged")
-    lines.append(f"• {total_issues} Issues Closed")
-    lines.append(f"• {total_contributors} Contributors")
+    lines.append(f"• {summary.customer_facing} Customer-Facing Features Shipped")
+    lines.append(f"• {summary.total_prs} Total Pull Requests Merged")
+    lines.append(f"• {summary.total_issues} Issues Closed")
+    lines.append(f"• {len(summary.contributors)} Contributors")
     lines.append("")
     lines.append("KEY CUSTOMER-FACING FEATURES")
     lines.append("")
     
-    # Extract and group customer features by type
-    feature_groups = defaultdict(list)
-    for item in customer_facing_items:
-        title = item['title']
-        title_lower = title.lower()
-        
-        if any(word in title_lower for word in ['skill', 'agent']):
-            feature_groups['New Agent Skills & Capabilities'].append(title)
-        elif any(word in title_lower for word in ['/context', '/compact', 'slash', 'command']):
-            feature_groups['New Commands & Features'].append(title)
-        elif any(word in title_lower for word in ['tool', 'mcp', 'github', 'web fetch']):
-            feature_groups['Tool Integrations'].append(title)
-        elif any(word in title_lower for word in ['model', 'picker', 'llm']):
-            feature_groups['Model Management'].append(title)
-        elif any(word in title_lower for word in ['auth', 'login', 'device code']):
-            feature_groups['Authentication'].append(title)
-        elif any(word in title_lower for word in ['handoff', 'continuity', 'resume', 'remote']):
-            feature_groups['Cross-Platform Continuity'].append(title)
-        elif any(word in title_lower for word in ['homebrew', 'winget', 'install', 'publish']):
-            feature_groups['Distribution & Installation'].append(title)
-        elif any(word in title_lower for word in ['ui', 'ux', 'display', 'tab completion']):
-            feature_groups['User Experience Improvements'].append(title)
-        elif any(word in title_lower for word in ['fix', 'bug', 'error']):
-            feature_groups['Bug Fixes'].append(title)
-        else:
-            feature_groups['Other Features'].append(title)
+    feature_groups = summary.feature_groups
     
     # Sort feature groups by priority for executives
     priority_order = [
@@ -632,19 +733,23 @@ def generate_executive_summary(all_items, repos, date_range, total_prs, total_is
         if group_name in feature_groups and feature_groups[group_name]:
             features = feature_groups[group_name]
             lines.append(f"{group_name} ({len(features)} items):")
-            # Show top 8 items per category
-            for feature in features[:8]:
+            # Show top 8 items per category, one line per cluster of near-duplicates
+            clusters = cluster_titles(features)
+            for members in clusters[:8]:
                 # Clean up the title for better readability
-                clean_title = feature.replace('[CLI]', '').replace('[CLI/CCA]', '').replace('CLI:', '').strip()
+                clean_title = features[members[0]].replace('[CLI]', '').replace('[CLI/CCA]', '').replace('CLI:', '').strip()
+                if len(members) > 1:
+                    clean_title += f" (×{len(members)} similar)"
                 lines.append(f"  • {clean_title}")
-            if len(features) > 8:
-                lines.append(f"  • ...and {len(features) - 8} more")
+            shown = sum(len(members) for members in clusters[:8])
+            if len(features) > shown:
+                lines.append(f"  • ...and {len(features) - shown} more")
             lines.append("")
     
     lines.append("")
     lines.append("DETAILED BREAKDOWN BY CATEGORY")
-    for category, items in sorted_categories:
-        lines.append(f"• {category}: {len(items)} items")
+    for category, count in sorted_categories:
+        lines.append(f"• {category}: {count} items")
     
     summary_text = '\n'.join(lines)
     
@@ -662,22 +767,320 @@ def generate_executive_summary(all_items, repos, date_range, total_prs, total_is
     return html
 
 
-def generate_items_html(items_by_repo):
-    """Generate HTML for items list."""
-    if not items_by_repo:
-        return '<div class="empty-state">No items found in the specified time period.</div>'
+class KLLSketch:
+    """Mergeable streaming quantile sketch (KLL).
+    
+    Values are kept in a stack of compactors; when a level fills up it is
+    sorted and every other value is promoted to the next level with twice the
+    weight. Memory stays O(k log(n/k)) and sketches built on separate shards
+    can be merged and queried as if they had seen every value.
+    """
+    
+    def __init__(self, k=200, seed=0):
+        self.k = k
+        self.count = 0
+        self.compactors = []
+        self._capacities = []
+        # Seeded so the same data always yields the same report
+        self._random = random.Random(seed)
+        self._grow()
+    
+    def _grow(self):
+        """Add a level; lower levels shrink geometrically relative to the top."""
+        self.compactors.append([])
+        height = len(self.compactors)
+        self._capacities = [max(2, int(math.ceil(self.k * (2 / 3) ** (height - level - 1))))
+                            for level in range(height)]
+    
+    def _compress(self):
+        while sum(len(c) for c in self.compactors) >= sum(self._capacities):
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) >= self._capacities[level]:
+                    if level + 1 == len(self.compactors):
+                        self._grow()
+                    compactor.sort()
+                    offset = self._random.randint(0, 1)
+                    self.compactors[level + 1].extend(compactor[offset::2])
+                    compactor.clear()
+                    break
+    
+    def update(self, value):
+        level0 = self.compactors[0]
+        level0.append(value)
+        self.count += 1
+        if len(level0) >= self._capacities[0]:
+            self._compress()
+    
+    def merge(self, other):
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.count += other.count
+        self._compress()
+        return self
+    
+    def quantile(self, q):
+        """Approximate q-quantile (0 <= q <= 1), or None if the sketch is empty."""
+        weighted = sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+        if not weighted:
+            return None
+        target = q * sum(weight for _, weight in weighted)
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+
+def week_start(date_str):
+    """Monday of the ISO week containing date_str, as YYYY-MM-DD."""
+    day = parse_date(date_str).date()
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+def new_cycle_metrics():
+    """Empty lead/resolution time sketches (in hours) keyed by repo, item type and week."""
+    return defaultdict(lambda: defaultdict(dict))
+
+
+def record_cycle_time(metrics, repo, item):
+    """Add one item to the cycle-time sketches.
+    
+    PR lead time is created -> merged and issue resolution time is
+    created -> closed. Items without a creation time are skipped.
+    """
+    if not item.get('created') or not item.get('date'):
+        return
+    hours = (parse_date(item['date']) - parse_date(item['created'])).total_seconds() / 3600
+    if hours < 0:
+        return
+    bins = metrics[repo][item['type']]
+    week = week_start(item['date'])
+    if week not in bins:
+        bins[week] = KLLSketch()
+    bins[week].update(hours)
+
+
+def merge_sketches(sketches):
+    """Combine sketches from several bins (or shards) into a new one."""
+    merged = KLLSketch()
+    for sketch in sketches:
+        merged.merge(sketch)
+    return merged
+
+
+def format_duration(hours):
+    """Compact human-readable duration for metric cells."""
+    if hours is None:
+        return '—'
+    if hours < 48:
+        return f'{hours:.1f}h'
+    return f'{hours / 24:.1f}d'
+
+
+def format_quantiles(sketch):
+    """p50, p90 and count cells for one sketch."""
+    if sketch is None or not sketch.count:
+        return '<td>—</td><td>—</td><td>0</td>'
+    return (f'<td>{format_duration(sketch.quantile(0.5))}</td>'
+            f'<td>{format_duration(sketch.quantile(0.9))}</td>'
+            f'<td>{sketch.count}</td>')
+
+
+def generate_cycle_time_section(metrics):
+    """Generate HTML for PR lead time and issue resolution time percentiles."""
+    if not metrics:
+        return ''
+    
+    header = '''
+        <tr>
+            <th>{label}</th>
+            <th>PR lead p50</th><th>PR lead p90</th><th>PRs</th>
+            <th>Issue resolution p50</th><th>Issue resolution p90</th><th>Issues</th>
+        </tr>
+    '''
     
     html_parts = []
+    html_parts.append('<div class="section">')
+    html_parts.append('<h2>⏱️ Cycle Time</h2>')
+    html_parts.append('<table class="metrics-table">')
+    html_parts.append(header.format(label='Repository'))
+    
+    totals = {'PR': [], 'Issue': []}
+    for repo in sorted(metrics):
+        row = [f'<td>{escape(repo)}</td>']
+        for item_type in ('PR', 'Issue'):
+            bins = metrics[repo].get(item_type, {})
+            totals[item_type].extend(bins.values())
+            row.append(format_quantiles(merge_sketches(bins.values()) if bins else None))
+        html_parts.append(f'<tr>{"".join(row)}</tr>')
+    
+    if len(metrics) > 1:
+        row = ['<td><strong>All repositories</strong></td>']
+        for item_type in ('PR', 'Issue'):
+            row.append(format_quantiles(merge_sketches(totals[item_type])))
+        html_parts.append(f'<tr>{"".join(row)}</tr>')
+    html_parts.append('</table>')
+    
+    for repo in sorted(metrics):
+        weeks = sorted(set(metrics[repo].get('PR', {})) | set(metrics[repo].get('Issue', {})), reverse=True)
+        html_parts.append('<details class="metrics-weekly">')
+        html_parts.append(f'<summary>Weekly breakdown for {escape(repo)}</summary>')
+        html_parts.append('<table class="metrics-table">')
+        html_parts.append(header.format(label='Week of'))
+        for week in weeks:
+            row = [f'<td>{week}</td>']
+            for item_type in ('PR', 'Issue'):
+                row.append(format_quantiles(metrics[repo].get(item_type, {}).get(week)))
+            html_parts.append(f'<tr>{"".join(row)}</tr>')
+        html_parts.append('</table>')
+        html_parts.append('</details>')
+    
+    html_parts.append('</div>')
+    
+    return ''.join(html_parts)
+
+
+# ---------------------------------------------------------------------------
+# Bounded-memory ordering
+#
+# With --memory-budget, items are streamed from the input one at a time: each
+# is fed to a ReportSummary and then added to its repo's ExternalSorter, so no
+# full item list is ever built. Once all buffered items together pass the
+# budget, the largest buffer is sorted newest-first and spilled to a temporary
+# JSON-lines run. Rendering then k-way merges the runs, which yields the same
+# order as sorted(items, key=date, reverse=True): runs hold consecutive slices
+# of the insertion order and heapq.merge keeps ties in run order.
+# ---------------------------------------------------------------------------
+
+# Rough per-item cost of a dict with its keys and small values, in bytes
+ITEM_OVERHEAD_BYTES = 600
+# Runs per repo before they are merged into one, bounding open files at render time
+SPILL_MAX_RUNS = 64
+
+
+def estimate_item_bytes(item):
+    return ITEM_OVERHEAD_BYTES + len(item['title']) + len(item['url']) + sum(len(label) for label in item.get('labels', []))
+
+
+def item_date(item):
+    return item['date']
+
+
+class SpillBudget:
+    """Shared memory budget for a set of ExternalSorters and their spill files."""
+    
+    def __init__(self, limit_bytes):
+        self.limit = limit_bytes
+        self.used = 0
+        self.sorters = []
+        self.spilled_runs = 0
+        self._tmpdir = tempfile.TemporaryDirectory(prefix='shipment-tracker-')
+    
+    def new_run_path(self):
+        self.spilled_runs += 1
+        return os.path.join(self._tmpdir.name, f'run-{self.spilled_runs}.jsonl')
+    
+    def charge(self, size):
+        self.used += size
+        while self.used > self.limit:
+            largest = max(self.sorters, key=lambda sorter: sorter.buffer_bytes)
+            if not largest.buffer:
+                break
+            largest.spill()
+    
+    def cleanup(self):
+        self._tmpdir.cleanup()
+
+
+class ExternalSorter:
+    """Item collection for one repo that iterates newest-first within a budget."""
+    
+    def __init__(self, budget):
+        self.budget = budget
+        self.buffer = []
+        self.buffer_bytes = 0
+        self.runs = []
+        self.count = 0
+        budget.sorters.append(self)
+    
+    def __len__(self):
+        return self.count
+    
+    def add(self, item):
+        size = estimate_item_bytes(item)
+        self.buffer.append(item)
+        self.buffer_bytes += size
+        self.count += 1
+        self.budget.charge(size)
+    
+    def spill(self):
+        """Write the buffer to disk as one newest-first run."""
+        path = self.budget.new_run_path()
+        with open(path, 'w', encoding='utf-8') as f:
+            for item in sorted(self.buffer, key=item_date, reverse=True):
+                f.write(json.dumps(item))
+                f.write('\n')
+        self.runs.append(path)
+        self.budget.used -= self.buffer_bytes
+        self.buffer = []
+        self.buffer_bytes = 0
+        if len(self.runs) >= SPILL_MAX_RUNS:
+            self._merge_runs()
+    
+    def _merge_runs(self):
+        """Collapse the spilled runs into one; merging in run order keeps ties stable."""
+        path = self.budget.new_run_path()
+        with open(path, 'w', encoding='utf-8') as f:
+            for item in heapq.merge(*map(self._read_run, self.runs), key=item_date, reverse=True):
+                f.write(json.dumps(item))
+                f.write('\n')
+        for run in self.runs:
+            os.remove(run)
+        self.runs = [path]
+    
+    @staticmethod
+    def _read_run(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
+    
+    def sorted_items(self):
+        """Items newest-first, merged from the spilled runs and the buffer."""
+        streams = [self._read_run(path) for path in self.runs]
+        streams.append(sorted(self.buffer, key=item_date, reverse=True))
+        return heapq.merge(*streams, key=item_date, reverse=True)
+    
+    def __iter__(self):
+        return self.sorted_items()
+
+
+def items_newest_first(items):
+    """Newest-first iteration over a plain list or an ExternalSorter."""
+    if isinstance(items, ExternalSorter):
+        return items.sorted_items()
+    return sorted(items, key=item_date, reverse=True)
+
+
+def iter_items_html(items_by_repo):
+    """Yield the items list HTML in pieces, so large reports can be streamed."""
+    if not items_by_repo:
+        yield '<div class="empty-state">No items found in the specified time period.</div>'
+        return
     
     for repo, items in sorted(items_by_repo.items()):
-        html_parts.append(f'<div class="repo-section">')
-        html_parts.append(f'<div class="repo-title">{escape(repo)}</div>')
-        html_parts.append('<ul class="items-list">')
+        yield f'<div class="repo-section">'
+        yield f'<div class="repo-title">{escape(repo)}</div>'
+        yield '<ul class="items-list">'
         
         # Sort by date (most recent first)
-        sorted_items = sorted(items, key=lambda x: x['date'], reverse=True)
-        
-        for item in sorted_items:
+        for item in items_newest_first(items):
             item_type = item['type']
             type_class = 'pr' if item_type == 'PR' else 'issue'
             
@@ -688,7 +1091,7 @@ def generate_items_html(items_by_repo):
                     for label in item['labels'][:5]  # Limit to 5 labels
                 ])
             
-            html_parts.append(f'''
+            yield f'''
                 <li class="item {type_class}" data-repo="{escape(repo)}">
                     <div class="item-main">
                         <div class="item-title">
@@ -704,12 +1107,10 @@ def generate_items_html(items_by_repo):
                     </div>
                     <div class="item-date">{format_date(item['date'])}</div>
                 </li>
-            ''')
+            '''
         
-        html_parts.append('</ul>')
-        html_parts.append('</div>')
-    
-    return ''.join(html_parts)
+        yield '</ul>'
+        yield '</div>'
 
 
 def load_json_stdin():
@@ -723,81 +1124,475 @@ def load_json_stdin():
     return None
 
 
-def main():
-    parser = argparse.ArgumentParser(description='Generate shipment report HTML')
-    parser.add_argument('--repos', required=True, help='Comma-separated list of repos')
-    parser.add_argument('--since', required=True, help='Start date (YYYY-MM-DD)')
-    parser.add_argument('--until', help='End date (YYYY-MM-DD)', default=None)
-    parser.add_argument('--output', default='shipment-report.html', help='Output file')
-    parser.add_argument('--prs-json', help='JSON file with PR data')
-    parser.add_argument('--issues-json', help='JSON file with issues data')
-    
-    args = parser.parse_args()
+def iter_json_lists(path, chunk_size=1 << 20):
+    """Yield (key, element) pairs from a {"key": [element, ...]} JSON file.
     
-    repos = [r.strip() for r in args.repos.split(',')]
+    The file is read in chunks and decoded one element at a time, so memory
+    stays proportional to the largest element rather than the whole file.
+    """
+    decoder = json.JSONDecoder()
+    whitespace = re.compile(r'[ \t\n\r]*')
+    buffer, pos, eof = '', 0, False
     
-    # Collect all items
+    with open(path, 'r', encoding='utf-8') as f:
+        def read_more():
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+        
+        def peek():
+            nonlocal pos
+            while True:
+                pos = whitespace.match(buffer, pos).end()
+                if pos < len(buffer):
+                    return buffer[pos]
+                if eof:
+                    raise ValueError(f'{path}: unexpected end of JSON')
+                read_more()
+        
+        def expect(*chars):
+            nonlocal pos
+            char = peek()
+            if char not in chars:
+                raise ValueError(f'{path}: expected {" or ".join(map(repr, chars))} but found {char!r}')
+            pos += 1
+            return char
+        
+        def value():
+            nonlocal pos
+            peek()
+            while True:
+                try:
+                    result, end = decoder.raw_decode(buffer, pos)
+                    # A value cut off by the chunk boundary (e.g. "2.5" of "2.5e3") can still
+                    # decode, so only trust it once the following delimiter is in the buffer
+                    after = whitespace.match(buffer, end).end()
+                    if eof or (after < len(buffer) and buffer[after] in ',:]}'):
+                        pos = end
+                        return result
+                except json.JSONDecodeError as e:
+                    if eof:
+                        raise ValueError(f'{path}: {e.msg}')
+                read_more()
+        
+        expect('{')
+        if peek() == '}':
+            return
+        while True:
+            key = value()
+            expect(':')
+            expect('[')
+            if peek() == ']':
+                pos += 1
+            else:
+                while True:
+                    yield key, value()
+                    if expect(',', ']') == ']':
+                        break
+            if expect(',', '}') == '}':
+                return
+
+
+def load_json_file(path):
+    """Load a gh JSON dump, returning an empty mapping if it can't be read."""
+    if not path:
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except:
+        return {}
+
+
+# gh JSON field holding each item type's ship date
+ITEM_DATE_FIELDS = {'PR': 'mergedAt', 'Issue': 'closedAt'}
+
+
+def normalize_item(item_type, record):
+    """One gh PR or issue record as a report item."""
+    return {
+        'type': item_type,
+        'number': record['number'],
+        'title': record['title'],
+        'author': record['author']['login'],
+        'date': record[ITEM_DATE_FIELDS[item_type]],
+        'created': record.get('createdAt'),
+        'url': record['url'],
+        'labels': [label['name'] for label in record.get('labels', [])]
+    }
+
+
+def load_items(pr_data, issue_data):
+    """Normalize gh PR and issue data into report items grouped by repo."""
     all_items = []
     items_by_repo = defaultdict(list)
     contributors = set()
     
-    # Load data from JSON files if provided
-    pr_data = {}
-    issue_data = {}
+    # Process PR data, then issue data
+    for item_type, data in (('PR', pr_data), ('Issue', issue_data)):
+        for repo, records in data.items():
+            for record in records:
+                item = normalize_item(item_type, record)
+                all_items.append(item)
+                items_by_repo[repo].append(item)
+                contributors.add(item['author'])
     
-    if args.prs_json:
-        try:
-            with open(args.prs_json, 'r') as f:
-                pr_data = json.load(f)
-        except:
-            pass
+    return all_items, items_by_repo, contributors
+
+
+# ---------------------------------------------------------------------------
+# Binary snapshots
+#
+# A snapshot stores normalized items column-wise so a dataset can be
+# re-rendered without re-parsing the original gh JSON. All strings (titles,
+# authors, labels, repos, URLs) are deduplicated into one string table and
+# every other field is a fixed-width little-endian column. Dates are kept as
+# their original ISO strings in the string table, so loading never reformats
+# timestamps. The file is read through mmap and items are built lazily, one
+# row at a time, so only the pages that are actually touched get loaded.
+#
+# Layout: header, then 8-byte aligned sections in SNAPSHOT_SECTIONS order.
+#   header   = magic, version, item count, script hash, (offset, count) per section
+#   strings  = UTF-8 blob indexed by string_offsets (count + 1 entries)
+#   labels   = label string ids, sliced per item by label_offsets (count + 1)
+# ---------------------------------------------------------------------------
+
+SNAPSHOT_MAGIC = b'SHIPSNAP'
+SNAPSHOT_VERSION = 3
+SNAPSHOT_TYPES = ('PR', 'Issue')
+
+# (section name, array typecode); 'strings' is the raw UTF-8 blob
+SNAPSHOT_SECTIONS = (
+    ('string_offsets', 'Q'),
+    ('strings', 'B'),
+    ('type', 'B'),
+    ('number', 'I'),
+    ('date', 'I'),
+    ('created', 'I'),
+    ('repo', 'I'),
+    ('title', 'I'),
+    ('author', 'I'),
+    ('url', 'I'),
+    ('category', 'I'),
+    ('label_offsets', 'I'),
+    ('labels', 'I'),
+)
+# Entries each section must hold relative to the item count; the rest are free-sized
+SNAPSHOT_SECTION_COUNTS = {
+    'type': 0, 'number': 0, 'date': 0, 'created': 0, 'repo': 0,
+    'title': 0, 'author': 0, 'url': 0, 'category': 0, 'label_offsets': 1,
+}
+SNAPSHOT_HEADER = struct.Struct('<8sII32s' + 'QQ' * len(SNAPSHOT_SECTIONS))
+
+
+def _column_bytes(typecode, values):
+    arr = array(typecode, values)
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def save_snapshot(path, all_items, repo_of):
+    """Write items (in all_items order) to a binary snapshot at path."""
+    string_ids = {}
+    blob = bytearray()
+    string_offsets = [0]
+    
+    def intern(value):
+        sid = string_ids.get(value)
+        if sid is None:
+            sid = string_ids[value] = len(string_offsets) - 1
+            blob.extend(value.encode('utf-8'))
+            string_offsets.append(len(blob))
+        return sid
+    
+    columns = {name: [] for name, _ in SNAPSHOT_SECTIONS if name not in ('string_offsets', 'strings')}
+    columns['label_offsets'].append(0)
     
-    if args.issues_json:
+    for item, repo in zip(all_items, repo_of):
+        columns['type'].append(SNAPSHOT_TYPES.index(item['type']))
+        columns['number'].append(item['number'])
+        columns['date'].append(intern(item['date'] or ''))
+        columns['created'].append(intern(item.get('created') or ''))
+        columns['repo'].append(intern(repo))
+        columns['title'].append(intern(item['title']))
+        columns['author'].append(intern(item['author']))
+        columns['url'].append(intern(item['url']))
+        columns['category'].append(intern(item_category(item)))
+        columns['labels'].extend(intern(label) for label in item.get('labels', []))
+        columns['label_offsets'].append(len(columns['labels']))
+    
+    sections = []
+    for name, typecode in SNAPSHOT_SECTIONS:
+        if name == 'strings':
+            sections.append((bytes(blob), len(blob)))
+        elif name == 'string_offsets':
+            sections.append((_column_bytes(typecode, string_offsets), len(string_offsets)))
+        else:
+            sections.append((_column_bytes(typecode, columns[name]), len(columns[name])))
+    
+    # Lay sections out after the header, each 8-byte aligned
+    table = []
+    offset = SNAPSHOT_HEADER.size
+    for data, count in sections:
+        offset = (offset + 7) & ~7
+        table.extend((offset, count))
+        offset += len(data)
+    
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(all_items),
+                                  bytes.fromhex(script_version()), *table)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        for (data, _), section_offset in zip(sections, table[::2]):
+            f.write(b'\0' * (section_offset - f.tell()))
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SnapshotReader:
+    """Memory-mapped view over a snapshot file; strings are decoded on demand."""
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
         try:
-            with open(args.issues_json, 'r') as f:
-                issue_data = json.load(f)
-        except:
-            pass
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap refuses empty files
+            self._file.close()
+            raise ValueError(f'{path} is not a shipment snapshot')
+        self._view = memoryview(self._mmap)
+        self._columns = {}
+        
+        try:
+            self._load_sections(path)
+        except Exception:
+            self.close()
+            raise
+        self._strings = [None] * (len(self._columns['string_offsets']) - 1)
+        self._items = [None] * self.count
     
-    # Process PR data
-    for repo, prs in pr_data.items():
-        for pr in prs:
-            item = {
-                'type': 'PR',
-                'number': pr['number'],
-                'title': pr['title'],
-                'author': pr['author']['login'],
-                'date': pr['mergedAt'],
-                'url': pr['url'],
-                'labels': [label['name'] for label in pr.get('labels', [])]
-            }
-            all_items.append(item)
-            items_by_repo[repo].append(item)
-            contributors.add(item['author'])
-    
-    # Process issue data
-    for repo, issues in issue_data.items():
-        for issue in issues:
-            item = {
-                'type': 'Issue',
-                'number': issue['number'],
-                'title': issue['title'],
-                'author': issue['author']['login'],
-                'date': issue['closedAt'],
-                'url': issue['url'],
-                'labels': [label['name'] for label in issue.get('labels', [])]
-            }
-            all_items.append(item)
-            items_by_repo[repo].append(item)
-            contributors.add(item['author'])
+    def _load_sections(self, path):
+        """Parse the header and map every section, rejecting truncated or inconsistent files."""
+        size = len(self._mmap)
+        if size < SNAPSHOT_HEADER.size:
+            raise ValueError(f'{path} is not a shipment snapshot')
+        fields = SNAPSHOT_HEADER.unpack_from(self._mmap, 0)
+        magic, version, self.count, rules_hash = fields[:4]
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f'{path} is not a shipment snapshot')
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f'{path} has snapshot version {version}, expected {SNAPSHOT_VERSION}')
+        # Categories were computed by whatever rules wrote the snapshot
+        self.rules_match = rules_hash.hex() == script_version()
+        
+        table = fields[4:]
+        for i, (name, typecode) in enumerate(SNAPSHOT_SECTIONS):
+            offset, count = table[2 * i], table[2 * i + 1]
+            end = offset + count * array(typecode).itemsize
+            if offset < SNAPSHOT_HEADER.size or end > size:
+                raise ValueError(f'{path} is truncated or corrupt (section {name} out of bounds)')
+            expected = SNAPSHOT_SECTION_COUNTS.get(name)
+            if expected is not None and count != self.count + expected:
+                raise ValueError(f'{path} is corrupt (section {name} has {count} entries, expected {self.count + expected})')
+            self._columns[name] = self._cast(self._view[offset:end], typecode)
+        
+        string_offsets = self._columns['string_offsets']
+        label_offsets = self._columns['label_offsets']
+        if not len(string_offsets) or string_offsets[-1] != len(self._columns['strings']):
+            raise ValueError(f'{path} is corrupt (string table size mismatch)')
+        if label_offsets[0] != 0 or label_offsets[-1] != len(self._columns['labels']):
+            raise ValueError(f'{path} is corrupt (label table size mismatch)')
     
-    # Generate statistics
-    total_prs = sum(1 for item in all_items if item['type'] == 'PR')
-    total_issues = sum(1 for item in all_items if item['type'] == 'Issue')
+    @staticmethod
+    def _cast(view, typecode):
+        if typecode == 'B':
+            return view
+        if sys.byteorder == 'big':
+            arr = array(typecode, view.tobytes())
+            arr.byteswap()
+            return arr
+        return view.cast(typecode)
     
-    # Format date range
-    until_str = args.until or datetime.now().strftime('%Y-%m-%d')
-    date_range = f"{args.since} to {until_str}"
+    def decode(self, sid):
+        """Decode one string without caching it."""
+        # Rows are only read on demand, so ids are checked here rather than on open
+        if not 0 <= sid < len(self._strings):
+            raise ValueError(f'{self.path} is corrupt (string id {sid} out of range)')
+        offsets = self._columns['string_offsets']
+        return bytes(self._columns['strings'][offsets[sid]:offsets[sid + 1]]).decode('utf-8')
+    
+    def string(self, sid):
+        value = self._strings[sid] if 0 <= sid < len(self._strings) else None
+        if value is None:
+            value = self._strings[sid] = self.decode(sid)
+        return value
+    
+    def column(self, name):
+        return self._columns[name]
+    
+    def iter_items(self, rows, cache=True):
+        """Item dicts for rows, read from the mapped columns as they are reached.
+        
+        With cache, each dict (and each string) is kept and reused, so item
+        identity is stable; without it nothing read is retained.
+        """
+        c = self._columns
+        types, numbers, titles, authors = c['type'], c['number'], c['title'], c['author']
+        dates, created, urls, categories = c['date'], c['created'], c['url'], c['category']
+        label_offsets, labels = c['label_offsets'], c['labels']
+        string = self.string if cache else self.decode
+        items, rules_match = self._items, self.rules_match
+        for row in rows:
+            item = items[row]
+            if item is None:
+                type_id = types[row]
+                if type_id >= len(SNAPSHOT_TYPES):
+                    raise ValueError(f'{self.path} is corrupt (unknown item type {type_id})')
+                item = {
+                    'type': SNAPSHOT_TYPES[type_id],
+                    'number': numbers[row],
+                    'title': string(titles[row]),
+                    'author': string(authors[row]),
+                    'date': string(dates[row]),
+                    'created': string(created[row]) or None,
+                    'url': string(urls[row]),
+                    'labels': [string(sid) for sid in labels[label_offsets[row]:label_offsets[row + 1]]],
+                }
+                if rules_match:
+                    item['category'] = string(categories[row])
+                if cache:
+                    items[row] = item
+            yield item
+    
+    def item(self, row):
+        return self._items[row] or next(self.iter_items((row,)))
+    
+    def close(self):
+        # Release exported buffers before closing the map
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        self._columns = {}
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+
+class SnapshotItems(Sequence):
+    """Read-only list of snapshot items, for all rows or a subset of them."""
+    
+    def __init__(self, reader, rows):
+        self._reader = reader
+        self._rows = rows
+    
+    def __len__(self):
+        return len(self._rows)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SnapshotItems(self._reader, self._rows[index])
+        return self._reader.item(self._rows[index])
+    
+    def __iter__(self):
+        return self._reader.iter_items(self._rows)
+
+
+def load_snapshot(path):
+    """Load a snapshot into the (all_items, items_by_repo, contributors) triple.
+    
+    Only the repo and author columns are read here; items are views over
+    the mapped file, built as they are reached, so the reader stays open
+    for as long as they are referenced.
+    """
+    reader = SnapshotReader(path)
+    try:
+        rows_by_repo = defaultdict(list)
+        for row, repo in enumerate(reader.column('repo').tolist()):
+            rows_by_repo[repo].append(row)
+        items_by_repo = defaultdict(list, {
+            reader.string(repo): SnapshotItems(reader, rows) for repo, rows in rows_by_repo.items()
+        })
+        contributors = {reader.string(sid) for sid in set(reader.column('author').tolist())}
+    except Exception:
+        reader.close()
+        raise
+    
+    all_items = SnapshotItems(reader, range(reader.count))
+    return all_items, items_by_repo, contributors
+
+
+def repos_in_order(all_items, items_by_repo):
+    """Repo name for each entry of all_items."""
+    repo_by_id = {id(item): repo for repo, items in items_by_repo.items() for item in items}
+    return [repo_by_id[id(item)] for item in all_items]
+
+
+class ReportSummary:
+    """Everything the report shows besides the item list, gathered in one pass.
+    
+    Items are fed one at a time with add(), so the summary sections can be
+    built while items are still being loaded. Apart from the titles of
+    customer-facing items, which the executive summary clusters, nothing
+    here grows with the number of items.
+    """
+    
+    def __init__(self):
+        self.total_items = 0
+        self.total_prs = 0
+        self.total_issues = 0
+        self.contributors = set()
+        self.date_counts = defaultdict(int)
+        self.category_counts = defaultdict(int)
+        self.customer_facing = 0
+        self.feature_groups = defaultdict(list)
+        self.cycle_metrics = new_cycle_metrics()
+    
+    def add(self, repo, item):
+        self.total_items += 1
+        if item['type'] == 'PR':
+            self.total_prs += 1
+        elif item['type'] == 'Issue':
+            self.total_issues += 1
+        self.contributors.add(item['author'])
+        self.date_counts[item['date'][:10]] += 1  # YYYY-MM-DD
+        self.category_counts[item_category(item)] += 1
+        if is_customer_facing(item):
+            self.customer_facing += 1
+            self.feature_groups[feature_group(item['title'])].append(item['title'])
+        # Sketches depend on the order items arrive in, which is load order here
+        record_cycle_time(self.cycle_metrics, repo, item)
+
+
+def summarize_items(all_items, items_by_repo):
+    """ReportSummary for an already-loaded set of items, fed in all_items order."""
+    summary = ReportSummary()
+    for repo, item in zip(repos_in_order(all_items, items_by_repo), all_items):
+        summary.add(repo, item)
+    return summary
+
+
+def compute_stats(summary, repos):
+    """Summary numbers printed after a report is written."""
+    return {
+        'total_items': summary.total_items,
+        'total_prs': summary.total_prs,
+        'total_issues': summary.total_issues,
+        'total_contributors': len(summary.contributors),
+        'total_repos': len(repos),
+    }
+
+
+# Stands in for the items list so a report can be split around it
+ITEMS_PLACEHOLDER = '\0items\0'
+
+
+def render_report_shell(summary, repos, since, until_str, assets=None):
+    """Render everything except the items list, returned as (head, tail)."""
+    stats = compute_stats(summary, repos)
+    date_range = f"{since} to {until_str}"
     
     # Generate repo options for filter
     repo_options = '\n'.join([
@@ -805,29 +1600,1145 @@ def main():
         for repo in sorted(repos)
     ])
     
-    # Generate HTML
+    head_assets, body_assets = assets or inline_assets()
+    
     html = HTML_TEMPLATE.format(
+        head_assets=head_assets,
+        body_assets=body_assets,
         date_range=date_range,
         repo_list=', '.join(repos),
-        total_prs=total_prs,
-        total_issues=total_issues,
-        total_items=len(all_items),
-        total_contributors=len(contributors),
-        executive_summary=generate_executive_summary(all_items, repos, date_range, total_prs, total_issues, len(contributors)),
-        category_summary=generate_category_summary(all_items),
-        timeline_bars=generate_timeline_bars(all_items, args.since, until_str),
-        items_html=generate_items_html(items_by_repo),
+        total_prs=stats['total_prs'],
+        total_issues=stats['total_issues'],
+        total_items=stats['total_items'],
+        total_contributors=stats['total_contributors'],
+        executive_summary=generate_executive_summary(summary, repos, date_range),
+        category_summary=generate_category_summary(summary.category_counts),
+        timeline_bars=generate_timeline_bars(summary.date_counts, since, until_str),
+        cycle_time=generate_cycle_time_section(summary.cycle_metrics),
+        items_html=ITEMS_PLACEHOLDER,
         repo_options=repo_options
     )
     
-    # Write output
-    with open(args.output, 'w', encoding='utf-8') as f:
+    head, tail = html.split(ITEMS_PLACEHOLDER)
+    return head, tail
+
+
+def write_report_streaming(path, summary, items_by_repo, repos, since, until_str, assets=None, minify=False):
+    """Render a report straight to path without holding the items HTML in memory."""
+    head, tail = render_report_shell(summary, repos, since, until_str, assets)
+    
+    # Unlink first so we never write through a hard link into the cache
+    if os.path.lexists(path):
+        os.remove(path)
+    with open(path, 'w', encoding='utf-8') as f:
+        if minify:
+            # Every piece boundary sits between two tags, where minify_html
+            # would drop the whitespace anyway, so stripping pieces matches it
+            f.write(minify_html(head).rstrip())
+            for part in iter_items_html(items_by_repo):
+                f.write(minify_html(part).strip())
+            f.write(minify_html(tail).lstrip())
+        else:
+            f.write(head)
+            for part in iter_items_html(items_by_repo):
+                f.write(part)
+            f.write(tail)
+
+
+# ---------------------------------------------------------------------------
+# Output assets and compression
+#
+# By default every report inlines REPORT_CSS and REPORT_JS so it works as a
+# standalone file. For large archives the shared mode writes them once as
+# content-hashed files that every report links to, and reports can also be
+# minified and written with precompressed siblings for static file servers.
+# ---------------------------------------------------------------------------
+
+COMPRESS_FORMATS = ('gzip', 'br')
+COMPRESS_SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+_warned_brotli = []
+
+
+def inline_assets():
+    """Head and body markup that embeds the CSS/JS directly in the report."""
+    return (
+        f'<style>\n{REPORT_CSS}    </style>',
+        f'<script>\n{REPORT_JS}    </script>',
+    )
+
+
+def asset_contents():
+    """Shared asset bodies keyed by extension, without template indentation."""
+    return {
+        'css': textwrap.dedent(REPORT_CSS).strip() + '\n',
+        'js': textwrap.dedent(REPORT_JS).strip() + '\n',
+    }
+
+
+def asset_names():
+    """Content-hashed file names for the shared assets."""
+    names = {}
+    for ext, content in asset_contents().items():
+        digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+        names[ext] = f'report.{digest}.{ext}'
+    return names
+
+
+def resolve_assets_dir(output_path, assets_dir=None):
+    """Shared assets live next to the report unless told otherwise."""
+    if assets_dir:
+        return os.path.abspath(assets_dir)
+    return os.path.join(os.path.dirname(os.path.abspath(output_path)), 'assets')
+
+
+def asset_href_prefix(output_path, assets_dir=None):
+    """URL prefix from the report to the shared assets directory."""
+    report_dir = os.path.dirname(os.path.abspath(output_path))
+    rel = os.path.relpath(resolve_assets_dir(output_path, assets_dir), report_dir)
+    return rel.replace(os.sep, '/')
+
+
+def shared_assets(output_path, assets_dir=None):
+    """Head and body markup that links to the shared, content-hashed assets."""
+    prefix = asset_href_prefix(output_path, assets_dir)
+    names = asset_names()
+    return (
+        f'<link rel="stylesheet" href="{escape(prefix)}/{names["css"]}">',
+        f'<script src="{escape(prefix)}/{names["js"]}"></script>',
+    )
+
+
+def write_shared_assets(output_path, assets_dir=None, compress=()):
+    """Write the shared assets once; existing hashed files are left untouched."""
+    target_dir = resolve_assets_dir(output_path, assets_dir)
+    os.makedirs(target_dir, exist_ok=True)
+    names = asset_names()
+    written = []
+    
+    for ext, content in asset_contents().items():
+        path = os.path.join(target_dir, names[ext])
+        if not os.path.exists(path):
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            written.append(path)
+        missing = [fmt for fmt in compress if not os.path.exists(path + COMPRESS_SUFFIXES[fmt])]
+        written.extend(write_compressed_siblings(path, missing))
+    
+    return written
+
+
+def minify_html(html):
+    """Collapse insignificant whitespace in markup, CSS and JS."""
+    # The executive summary is rendered with white-space: pre-wrap, so leave it alone
+    parts = re.split(r'(<div class="executive-summary-content"[^>]*>.*?</div>|<style>.*?</style>|<script>.*?</script>)', html, flags=re.S)
+    out = []
+    for part in parts:
+        if part.startswith('<div class="executive-summary-content"'):
+            out.append(part)
+        elif part.startswith('<style>'):
+            css = re.sub(r'\s+', ' ', part[len('<style>'):-len('</style>')])
+            css = re.sub(r'\s*([{};,])\s*', r'\1', css)
+            css = re.sub(r':\s+', ':', css)
+            out.append(f'<style>{css.strip()}</style>')
+        elif part.startswith('<script>'):
+            # Keep line breaks so we never depend on semicolon insertion rules
+            js_lines = [line.strip() for line in part.split('\n')]
+            out.append('\n'.join(line for line in js_lines if line))
+        else:
+            part = re.sub(r'>\s+<', '><', part)
+            out.append(re.sub(r'\s{2,}', ' ', part))
+    return ''.join(out)
+
+
+def write_compressed_siblings(path, formats):
+    """Write precompressed copies (e.g. report.html.gz) next to path."""
+    if not formats:
+        return []
+    with open(path, 'rb') as f:
+        data = f.read()
+    
+    written = []
+    for fmt in formats:
+        if fmt == 'gzip':
+            # mtime=0 keeps the output byte-for-byte reproducible
+            payload = gzip.compress(data, compresslevel=9, mtime=0)
+        elif fmt == 'br':
+            try:
+                import brotli
+            except ImportError:
+                if not _warned_brotli:
+                    print("   ⚠️  Skipping .br output: install the 'brotli' package for Brotli compression")
+                    _warned_brotli.append(True)
+                continue
+            payload = brotli.compress(data)
+        else:
+            continue
+        
+        target = path + COMPRESS_SUFFIXES[fmt]
+        tmp_path = f'{target}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, target)
+        written.append(target)
+    
+    return written
+
+
+def parse_compress_formats(value):
+    """Parse --compress, e.g. "gzip,br"."""
+    if not value:
+        return []
+    formats = [fmt.strip() for fmt in value.split(',') if fmt.strip()]
+    for fmt in formats:
+        if fmt not in COMPRESS_FORMATS:
+            raise argparse.ArgumentTypeError(f"unknown compression format '{fmt}' (choose from {', '.join(COMPRESS_FORMATS)})")
+    return formats
+
+
+# ---------------------------------------------------------------------------
+# Output cache
+#
+# Reports are cached under a key derived from the script itself (which covers
+# the categorization rules and template), the normalized arguments and the raw
+# bytes of every input file. Entries are evicted least-recently-used first once
+# the cache directory grows past its size budget.
+# ---------------------------------------------------------------------------
+
+# Arguments that affect where or whether we cache, but not what is rendered.
+CACHE_EXCLUDED_ARGS = {'output', 'cache_dir', 'no_cache', 'cache_max_mb', 'compress', 'save_snapshot', 'memory_budget'}
+
+
+def default_cache_dir():
+    """Per-user cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'shipment-tracker')
+
+
+def script_version():
+    """Hash of this script, so any change to rules or templates busts the cache."""
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compute_cache_key(args, until_str, input_paths):
+    """Content-address a report by script version, arguments and input bytes."""
+    h = hashlib.sha256()
+    h.update(script_version().encode())
+    
+    normalized = {k: v for k, v in sorted(vars(args).items()) if k not in CACHE_EXCLUDED_ARGS}
+    normalized['repos'] = [r.strip() for r in args.repos.split(',')]
+    normalized['until'] = until_str
+    for key in ('prs_json', 'issues_json', 'load_snapshot'):
+        normalized[key] = bool(normalized.get(key))
+    # Shared-asset reports only depend on where the assets are relative to the report
+    normalized['assets_dir'] = asset_href_prefix(args.output, args.assets_dir) if args.assets == 'shared' else None
+    h.update(json.dumps(normalized, sort_keys=True).encode())
+    
+    for path in input_paths:
+        h.update(b'\0')
+        if not path:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    h.update(chunk)
+        except OSError:
+            h.update(b'<unreadable>')
+    
+    return h.hexdigest()
+
+
+def cache_lookup(cache_dir, key):
+    """Return (report_path, stats) for a cached report, or None on a miss."""
+    report_path = os.path.join(cache_dir, key + '.html')
+    meta_path = os.path.join(cache_dir, key + '.json')
+    try:
+        with open(meta_path, 'r') as f:
+            stats = json.load(f)
+        if not os.path.exists(report_path):
+            return None
+    except (OSError, ValueError):
+        return None
+    
+    # Touch both files so eviction treats them as recently used
+    for path in (report_path, meta_path):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    return report_path, stats
+
+
+def cache_store(cache_dir, key, output_path, stats):
+    """Copy a freshly generated report into the cache."""
+    os.makedirs(cache_dir, exist_ok=True)
+    report_path = os.path.join(cache_dir, key + '.html')
+    meta_path = os.path.join(cache_dir, key + '.json')
+    
+    # Write to temp files and rename so concurrent runs never see partial entries
+    tmp_report = f'{report_path}.{os.getpid()}.tmp'
+    shutil.copyfile(output_path, tmp_report)
+    os.replace(tmp_report, report_path)
+    
+    tmp_meta = f'{meta_path}.{os.getpid()}.tmp'
+    with open(tmp_meta, 'w') as f:
+        json.dump(stats, f)
+    os.replace(tmp_meta, meta_path)
+
+
+def cache_evict(cache_dir, max_bytes):
+    """Remove least-recently-used entries until the cache fits in max_bytes."""
+    entries = defaultdict(list)
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    
+    for name in names:
+        key, ext = os.path.splitext(name)
+        if ext not in ('.html', '.json'):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries[key].append((path, st.st_size, st.st_mtime))
+    
+    total = sum(size for files in entries.values() for _, size, _ in files)
+    by_age = sorted(entries.values(), key=lambda files: max(mtime for _, _, mtime in files))
+    for files in by_age:
+        if total <= max_bytes:
+            break
+        for path, size, _ in files:
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+def materialize_cached(report_path, output_path):
+    """Place a cached report at output_path, hard-linking when possible."""
+    if os.path.lexists(output_path):
+        os.remove(output_path)
+    try:
+        os.link(report_path, output_path)
+    except OSError:
+        shutil.copyfile(report_path, output_path)
+
+
+def write_report(path, html):
+    """Write report HTML, replacing rather than writing through any existing link."""
+    # Unlink first so we never write through a hard link into the cache
+    if os.path.lexists(path):
+        os.remove(path)
+    with open(path, 'w', encoding='utf-8') as f:
         f.write(html)
+
+
+def finalize_output(args):
+    """Write shared assets and compressed siblings for a report already on disk.
+    
+    Returns progress lines for the caller to print.
+    """
+    messages = []
+    if args.assets == 'shared':
+        for path in write_shared_assets(args.output, args.assets_dir, args.compress):
+            messages.append(f"   📎 Wrote shared asset: {path}")
+    for path in write_compressed_siblings(args.output, args.compress):
+        messages.append(f"   🗜️  Wrote {path} ({os.path.getsize(path)} bytes)")
+    return messages
+
+
+def load_dataset(args, parser):
+    """Load items from a snapshot or gh JSON files, optionally saving a snapshot."""
+    if args.load_snapshot:
+        started = time.perf_counter()
+        try:
+            all_items, items_by_repo, contributors = load_snapshot(args.load_snapshot)
+        except (OSError, ValueError, IndexError, struct.error) as e:
+            parser.error(f'could not load snapshot: {e}')
+        print(f"📼 Loaded snapshot {args.load_snapshot} ({len(all_items)} items, {(time.perf_counter() - started) * 1000:.0f} ms)")
+    else:
+        # Load data from JSON files if provided
+        pr_data = load_json_file(args.prs_json)
+        issue_data = load_json_file(args.issues_json)
+        all_items, items_by_repo, contributors = load_items(pr_data, issue_data)
+    
+    if args.save_snapshot:
+        save_snapshot(args.save_snapshot, all_items, repos_in_order(all_items, items_by_repo))
+        print(f"📼 Saved snapshot {args.save_snapshot} ({os.path.getsize(args.save_snapshot)} bytes)")
+    
+    return all_items, items_by_repo, contributors
+
+
+def iter_dataset_items(args):
+    """Yield (repo, item) in load order straight from the input, keeping nothing."""
+    if args.load_snapshot:
+        reader = SnapshotReader(args.load_snapshot)
+        try:
+            repo_ids = reader.column('repo')
+            for row, item in enumerate(reader.iter_items(range(reader.count), cache=False)):
+                yield reader.string(repo_ids[row]), item
+        finally:
+            reader.close()
+        return
+    
+    for item_type, path in (('PR', args.prs_json), ('Issue', args.issues_json)):
+        if path:
+            for repo, record in iter_json_lists(path):
+                yield repo, normalize_item(item_type, record)
+
+
+def load_dataset_budgeted(args, parser, budget):
+    """Stream items into a ReportSummary and per-repo ExternalSorters.
+    
+    Returns (summary, items_by_repo) where items_by_repo maps repos to
+    sorters; no list of all items is ever built.
+    """
+    started = time.perf_counter()
+    summary = ReportSummary()
+    items_by_repo = {}
+    try:
+        for repo, item in iter_dataset_items(args):
+            summary.add(repo, item)
+            if repo not in items_by_repo:
+                items_by_repo[repo] = ExternalSorter(budget)
+            items_by_repo[repo].add(item)
+    except (OSError, ValueError, IndexError, struct.error) as e:
+        parser.error(f'could not load items: {e}')
+    except (KeyError, TypeError) as e:
+        parser.error(f'could not load items: unexpected gh JSON record ({type(e).__name__}: {e})')
+    print(f"💽 Streamed {summary.total_items} items in {(time.perf_counter() - started) * 1000:.0f} ms, "
+          f"spilled {budget.spilled_runs} sorted runs to disk")
+    return summary, items_by_repo
+
+
+# ---------------------------------------------------------------------------
+# Batch mode
+#
+# --batch renders many reports from a single load. Items are classified once
+# and indexed per repo in date order, so each report only bisects its window
+# out of the shared index instead of re-reading and re-filtering everything.
+#
+# Config format:
+#   {
+#     "prs_json": "prs.json", "issues_json": "issues.json",   (or "load_snapshot")
+#     "since": "2024-01-01", "until": "2024-03-31",           (defaults for reports)
+#     "assets": "shared", "minify": true, "compress": "gzip", (output defaults)
+#     "jobs": 4,
+#     "reports": [
+#       {"output": "team-a.html", "repos": ["o/a", "o/b"]},
+#       {"output": "o-a-bugs.html", "repos": ["o/a"], "labels": ["bug"]},
+#       {"output": "week-10.html", "since": "2024-03-04", "until": "2024-03-10"}
+#     ]
+#   }
+# Report filters: repos, since, until, types ("PR"/"Issue"), labels, authors.
+# ---------------------------------------------------------------------------
+
+BATCH_OUTPUT_OPTIONS = ('assets', 'assets_dir', 'minify', 'compress')
+
+# Shared index for batch workers; set in the parent or by the pool initializer
+_batch_index = None
+
+
+def build_item_index(all_items, items_by_repo):
+    """Classify items once and index them per repo in date order.
+    
+    Each repo maps to parallel lists (day keys, insertion ordinals, items)
+    sorted by date, so a window is two bisects and the original insertion
+    order can be restored from the ordinals.
+    """
+    ordinal = {id(item): i for i, item in enumerate(all_items)}
+    index = {}
+    for repo, items in items_by_repo.items():
+        for item in items:
+            if 'category' not in item:
+                item['category'] = categorize_item(item['title'], item['type'])
+        entries = sorted((item['date'][:10], ordinal[id(item)], item) for item in items)
+        index[repo] = (
+            [day for day, _, _ in entries],
+            [pos for _, pos, _ in entries],
+            [item for _, _, item in entries],
+        )
+    return index
+
+
+def select_items(index, repos, since, until, types=None, labels=None, authors=None):
+    """Pull one report's items out of the shared index."""
+    selected = []
+    for repo in repos:
+        if repo not in index:
+            continue
+        days, ordinals, items = index[repo]
+        lo = bisect.bisect_left(days, since) if since else 0
+        hi = bisect.bisect_right(days, until) if until else len(days)
+        for pos, item in zip(ordinals[lo:hi], items[lo:hi]):
+            if types and item['type'] not in types:
+                continue
+            if authors and item['author'] not in authors:
+                continue
+            if labels and not labels.intersection(item.get('labels', [])):
+                continue
+            selected.append((pos, repo, item))
+    
+    # Restore the order items were loaded in, which the executive summary relies on
+    selected.sort(key=lambda entry: entry[0])
+    all_items = []
+    items_by_repo = defaultdict(list)
+    contributors = set()
+    for _, repo, item in selected:
+        all_items.append(item)
+        items_by_repo[repo].append(item)
+        contributors.add(item['author'])
+    return all_items, items_by_repo, contributors
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(',') if v.strip()]
+    return list(value)
+
+
+def load_batch_config(path, args):
+    """Read a batch config and resolve every report spec against its defaults."""
+    with open(path, 'r') as f:
+        config = json.load(f)
+    if not isinstance(config.get('reports'), list) or not config['reports']:
+        raise ValueError('batch config needs a non-empty "reports" list')
+    
+    base_dir = os.path.dirname(os.path.abspath(path))
+    resolve = lambda p: os.path.join(base_dir, p) if p else p
+    today = datetime.now().strftime('%Y-%m-%d')
+    
+    # Output options fall back from report -> config -> command line
+    defaults = {name: getattr(args, name) for name in BATCH_OUTPUT_OPTIONS}
+    defaults.update({name: config[name] for name in BATCH_OUTPUT_OPTIONS if name in config})
+    if config.get('assets_dir'):
+        defaults['assets_dir'] = resolve(config['assets_dir'])
+    
+    specs = []
+    for i, report in enumerate(config['reports']):
+        if not report.get('output'):
+            raise ValueError(f'report #{i + 1} is missing "output"')
+        options = {name: report.get(name, defaults[name]) for name in BATCH_OUTPUT_OPTIONS}
+        if isinstance(options['compress'], str):
+            options['compress'] = parse_compress_formats(options['compress'])
+        if report.get('assets_dir'):
+            options['assets_dir'] = resolve(report['assets_dir'])
+        types = set(_as_list(report.get('types')))
+        if not types <= set(SNAPSHOT_TYPES):
+            raise ValueError(f'report #{i + 1} has unknown types {sorted(types - set(SNAPSHOT_TYPES))}; '
+                             f'expected {" or ".join(SNAPSHOT_TYPES)}')
+        specs.append({
+            'output': resolve(report['output']),
+            'repos': _as_list(report.get('repos')),
+            'since': report.get('since', config.get('since')),
+            'until': report.get('until', config.get('until')) or today,
+            'types': types,
+            'labels': set(_as_list(report.get('labels'))),
+            'authors': set(_as_list(report.get('authors'))),
+            **options,
+        })
+    
+    sources = {
+        'prs_json': args.prs_json or resolve(config.get('prs_json')),
+        'issues_json': args.issues_json or resolve(config.get('issues_json')),
+        'load_snapshot': args.load_snapshot or resolve(config.get('load_snapshot')),
+    }
+    jobs = args.jobs or config.get('jobs', 1)
+    return specs, sources, jobs
+
+
+def _init_batch_worker(index):
+    global _batch_index
+    _batch_index = index
+
+
+def render_batch_report(spec):
+    """Render and write one batch report using the shared index."""
+    started = time.perf_counter()
+    repos = spec['repos'] or sorted(_batch_index)
+    all_items, items_by_repo, contributors = select_items(
+        _batch_index, repos, spec['since'], spec['until'],
+        spec['types'], spec['labels'], spec['authors'])
+    
+    output_args = argparse.Namespace(**spec)
+    assets = shared_assets(spec['output'], spec['assets_dir']) if spec['assets'] == 'shared' else None
+    os.makedirs(os.path.dirname(os.path.abspath(spec['output'])), exist_ok=True)
+    summary = summarize_items(all_items, items_by_repo)
+    write_report_streaming(spec['output'], summary, items_by_repo, repos,
+                           spec['since'] or 'the beginning', spec['until'],
+                           assets=assets, minify=spec['minify'])
+    messages = finalize_output(output_args)
+    
+    return compute_stats(summary, repos), messages, time.perf_counter() - started
+
+
+def run_batch(args, parser):
+    global _batch_index
+    try:
+        specs, sources, jobs = load_batch_config(args.batch, args)
+    except (OSError, ValueError, argparse.ArgumentTypeError) as e:
+        parser.error(f'could not read batch config: {e}')
+    if sources['load_snapshot'] and (sources['prs_json'] or sources['issues_json']):
+        parser.error('batch config cannot combine load_snapshot with prs_json/issues_json')
+    
+    started = time.perf_counter()
+    all_items, items_by_repo, _ = load_dataset(argparse.Namespace(**sources, save_snapshot=args.save_snapshot), parser)
+    _batch_index = build_item_index(all_items, items_by_repo)
+    print(f"📚 Loaded and indexed {len(all_items)} items in {time.perf_counter() - started:.2f}s; rendering {len(specs)} reports")
+    for spec in specs:
+        unknown = [repo for repo in spec['repos'] if repo not in _batch_index]
+        if unknown:
+            print(f"   ⚠️  {spec['output']}: no items for {', '.join(unknown)}")
     
-    print(f"✅ Report generated: {args.output}")
-    print(f"   {len(all_items)} total items ({total_prs} PRs, {total_issues} issues)")
-    print(f"   {len(contributors)} contributors")
-    print(f"   {len(repos)} repositories")
+    if jobs > 1:
+        # Rendering is CPU-bound, so use processes; each worker receives the index once
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                                                    initargs=(_batch_index,)) as pool:
+            results = list(pool.map(render_batch_report, specs))
+    else:
+        results = [render_batch_report(spec) for spec in specs]
+    
+    for spec, (stats, messages, elapsed) in zip(specs, results):
+        for message in messages:
+            print(message)
+        print_report_summary(spec['output'], stats)
+        print(f"   Rendered in {elapsed * 1000:.0f} ms")
+    print(f"📚 Batch complete: {len(specs)} reports in {time.perf_counter() - started:.2f}s")
+
+
+# ---------------------------------------------------------------------------
+# Report server
+#
+# `generate-report.py serve` keeps the normalized items in memory and answers
+# filter/paginate/aggregate queries over a small JSON API, so very large
+# datasets don't have to be rendered into a single static page. Every filter
+# is answered from postings lists built once at startup and results are
+# ordered by a precomputed date rank.
+#
+#   GET /                 viewer page
+#   GET /api/meta         repos, labels, authors and totals
+#   GET /api/items        ?repo=&type=&label=&author=&q=&page=&per_page=
+#   GET /api/timeline     same filters plus ?bin=day|week|month
+# ---------------------------------------------------------------------------
+
+SERVE_MAX_PER_PAGE = 500
+
+SERVE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Shipment Explorer</title>
+    {head_assets}
+</head>
+<body>
+    <div class="container">
+        <h1>📦 Shipment Explorer</h1>
+        <div class="subtitle" id="subtitle">Loading…</div>
+
+        <div class="section timeline">
+            <h2>📊 Timeline</h2>
+            <div class="filters">
+                <div class="filter-group">
+                    <label>Group by:</label>
+                    <select id="binFilter" onchange="refresh()">
+                        <option value="day">Day</option>
+                        <option value="week" selected>Week</option>
+                        <option value="month">Month</option>
+                    </select>
+                </div>
+            </div>
+            <div class="timeline-chart">
+                <div class="timeline-bars" id="timelineBars"></div>
+            </div>
+        </div>
+
+        <div class="section">
+            <h2>🚀 Shipped Items</h2>
+            <div class="filters">
+                <div class="filter-group">
+                    <label>Type:</label>
+                    <select id="typeFilter" onchange="refresh()">
+                        <option value="">All</option>
+                        <option value="PR">PRs Only</option>
+                        <option value="Issue">Issues Only</option>
+                    </select>
+                </div>
+                <div class="filter-group">
+                    <label>Repository:</label>
+                    <select id="repoFilter" onchange="refresh()"><option value="">All Repositories</option></select>
+                </div>
+                <div class="filter-group">
+                    <label>Label:</label>
+                    <select id="labelFilter" onchange="refresh()"><option value="">Any</option></select>
+                </div>
+                <div class="filter-group">
+                    <label>Author:</label>
+                    <select id="authorFilter" onchange="refresh()"><option value="">Anyone</option></select>
+                </div>
+                <div class="filter-group">
+                    <label>Search:</label>
+                    <input type="text" id="searchInput" placeholder="Words in title..." oninput="debouncedRefresh()">
+                </div>
+            </div>
+            <div class="subtitle" id="resultCount"></div>
+            <ul class="items-list" id="itemsList"></ul>
+            <div class="filters">
+                <button class="copy-button" id="prevButton" onclick="changePage(-1)">← Previous</button>
+                <span id="pageInfo"></span>
+                <button class="copy-button" id="nextButton" onclick="changePage(1)">Next →</button>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        let page = 1;
+        let timer = null;
+
+        function esc(value) {{
+            const div = document.createElement('div');
+            div.textContent = value;
+            return div.innerHTML;
+        }}
+
+        function filterParams() {{
+            const params = new URLSearchParams();
+            const fields = {{repo: 'repoFilter', type: 'typeFilter', label: 'labelFilter', author: 'authorFilter', q: 'searchInput'}};
+            for (const [name, id] of Object.entries(fields)) {{
+                const value = document.getElementById(id).value.trim();
+                if (value) params.set(name, value);
+            }}
+            return params;
+        }}
+
+        function fillSelect(id, values) {{
+            const select = document.getElementById(id);
+            for (const value of values) {{
+                const option = document.createElement('option');
+                option.value = value;
+                option.textContent = value;
+                select.appendChild(option);
+            }}
+        }}
+
+        async function loadMeta() {{
+            const meta = await (await fetch('/api/meta')).json();
+            document.getElementById('subtitle').textContent =
+                `${{meta.total_items}} items • ${{meta.total_prs}} PRs • ${{meta.total_issues}} issues • ${{meta.repos.length}} repositories`;
+            fillSelect('repoFilter', meta.repos);
+            fillSelect('labelFilter', meta.labels);
+            fillSelect('authorFilter', meta.authors);
+        }}
+
+        async function loadItems() {{
+            const params = filterParams();
+            params.set('page', page);
+            const data = await (await fetch('/api/items?' + params)).json();
+            const pages = Math.max(1, Math.ceil(data.total / data.per_page));
+            document.getElementById('resultCount').textContent = `${{data.total}} matching items`;
+            document.getElementById('pageInfo').textContent = ` Page ${{data.page}} of ${{pages}} `;
+            document.getElementById('prevButton').disabled = data.page <= 1;
+            document.getElementById('nextButton').disabled = data.page >= pages;
+            document.getElementById('itemsList').innerHTML = data.items.map(item => {{
+                const typeClass = item.type === 'PR' ? 'pr' : 'issue';
+                const labels = item.labels.slice(0, 5).map(l => `<span class="label-badge">${{esc(l)}}</span>`).join(' ');
+                return `<li class="item ${{typeClass}}">
+                    <div class="item-main">
+                        <div class="item-title">
+                            <span class="badge ${{typeClass}}">${{item.type}}</span>
+                            <a href="${{esc(item.url)}}" target="_blank">#${{item.number}} ${{esc(item.title)}}</a>
+                        </div>
+                        <div class="item-meta">${{esc(item.repo)}} • by ${{esc(item.author)}}${{labels ? ' • ' + labels : ''}}</div>
+                    </div>
+                    <div class="item-date">${{item.date.slice(0, 10)}}</div>
+                </li>`;
+            }}).join('') || '<div class="empty-state">No matching items.</div>';
+        }}
+
+        async function loadTimeline() {{
+            const params = filterParams();
+            params.set('bin', document.getElementById('binFilter').value);
+            const data = await (await fetch('/api/timeline?' + params)).json();
+            const max = Math.max(1, ...data.bins.map(b => b.count));
+            document.getElementById('timelineBars').innerHTML = data.bins.map(b =>
+                `<div class="timeline-bar" style="height: ${{b.count / max * 100}}%">
+                    <div class="timeline-bar-tooltip">${{b.bin}}: ${{b.count}} items</div>
+                </div>`).join('') || '<div class="empty-state">No data to display</div>';
+        }}
+
+        function refresh() {{
+            page = 1;
+            loadItems();
+            loadTimeline();
+        }}
+
+        function debouncedRefresh() {{
+            clearTimeout(timer);
+            timer = setTimeout(refresh, 200);
+        }}
+
+        function changePage(delta) {{
+            page += delta;
+            loadItems();
+        }}
+
+        loadMeta().then(refresh);
+    </script>
+</body>
+</html>
+"""
+
+
+def title_tokens(title):
+    return re.findall(r'\w+', title.lower())
+
+
+def time_bin(date_str, bin_size):
+    """Bucket key for a date: YYYY-MM-DD (day or week start) or YYYY-MM."""
+    if bin_size == 'month':
+        return date_str[:7]
+    if bin_size == 'week':
+        return week_start(date_str)
+    return date_str[:10]
+
+
+class ItemQueryIndex:
+    """Read-only postings indexes over loaded items for the report server.
+    
+    Items are numbered by their position in date-descending order, so every
+    postings list is a sorted list of positions and a filtered result is
+    already in display order once its postings are intersected.
+    """
+    
+    def __init__(self, all_items, items_by_repo):
+        repo_of = repos_in_order(all_items, items_by_repo)
+        order = sorted(range(len(all_items)), key=lambda i: (all_items[i]['date'], -i), reverse=True)
+        self.items = []
+        self.repos = []
+        self.by_repo = defaultdict(list)
+        self.by_type = defaultdict(list)
+        self.by_label = defaultdict(list)
+        self.by_author = defaultdict(list)
+        self.by_token = defaultdict(list)
+        
+        for pos, i in enumerate(order):
+            item, repo = all_items[i], repo_of[i]
+            self.items.append(item)
+            self.repos.append(repo)
+            self.by_repo[repo].append(pos)
+            self.by_type[item['type']].append(pos)
+            self.by_author[item['author']].append(pos)
+            for label in set(item.get('labels', [])):
+                self.by_label[label].append(pos)
+            for token in set(title_tokens(item['title'])):
+                self.by_token[token].append(pos)
+        
+        # Sorted vocabulary so search terms can match as word prefixes
+        self.vocabulary = sorted(self.by_token)
+        self.issue_flags = [int(item['type'] != 'PR') for item in self.items]
+        self.date_bins = {}
+        self.unfiltered_timelines = {}
+    
+    def _prefix_postings(self, prefix):
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        matches = set()
+        for token in itertools.islice(self.vocabulary, start, None):
+            if not token.startswith(prefix):
+                break
+            matches.update(self.by_token[token])
+        return matches
+    
+    def query(self, repo=None, item_type=None, label=None, author=None, text=None):
+        """Sorted positions matching every given filter (None means all items).
+        
+        The result may be one of the index's own postings lists; don't modify it.
+        """
+        postings = []
+        for index, key in ((self.by_repo, repo), (self.by_type, item_type),
+                           (self.by_label, label), (self.by_author, author)):
+            if key:
+                postings.append(index.get(key, []))
+        # Text without any word characters (e.g. "#") doesn't filter anything
+        tokens = title_tokens(text or '')
+        if not postings and not tokens:
+            return None
+        if len(postings) == 1 and not tokens:
+            # Postings lists are already in position order
+            return postings[0]
+        
+        # Intersect smallest-first so we touch as few positions as possible
+        postings.sort(key=len)
+        result = set(postings[0]) if postings else None
+        for plist in postings[1:]:
+            result.intersection_update(plist)
+            if not result:
+                return []
+        for token in tokens:
+            matches = self._prefix_postings(token)
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        return sorted(result)
+    
+    def page(self, positions, page, per_page):
+        total = len(self.items) if positions is None else len(positions)
+        start = (page - 1) * per_page
+        selected = range(start, min(start + per_page, total)) if positions is None else positions[start:start + per_page]
+        items = []
+        for pos in selected:
+            item = self.items[pos]
+            items.append({
+                'repo': self.repos[pos],
+                'type': item['type'],
+                'number': item['number'],
+                'title': item['title'],
+                'author': item['author'],
+                'date': item['date'],
+                'url': item['url'],
+                'labels': item.get('labels', []),
+                'category': item_category(item),
+            })
+        return total, items
+    
+    def timeline(self, positions, bin_size):
+        if bin_size not in self.date_bins:
+            # Bin keys per position are computed once per bin size and reused;
+            # many items share a day, so bin each distinct day only once
+            by_day = {}
+            keys = []
+            for item in self.items:
+                day = item['date'][:10]
+                key = by_day.get(day)
+                if key is None:
+                    key = by_day[day] = time_bin(day, bin_size)
+                keys.append(key)
+            self.date_bins[bin_size] = keys
+        if positions is None and bin_size in self.unfiltered_timelines:
+            return self.unfiltered_timelines[bin_size]
+        
+        keys = self.date_bins[bin_size]
+        counts = defaultdict(lambda: [0, 0])
+        for pos in (range(len(self.items)) if positions is None else positions):
+            counts[keys[pos]][self.issue_flags[pos]] += 1
+        bins = [
+            {'bin': key, 'count': prs + issues, 'prs': prs, 'issues': issues}
+            for key, (prs, issues) in sorted(counts.items())
+        ]
+        if positions is None:
+            self.unfiltered_timelines[bin_size] = bins
+        return bins
+    
+    def meta(self):
+        return {
+            'total_items': len(self.items),
+            'total_prs': len(self.by_type.get('PR', [])),
+            'total_issues': len(self.by_type.get('Issue', [])),
+            'repos': sorted(self.by_repo),
+            # Most used labels first; the page only needs a manageable list
+            'labels': sorted(self.by_label, key=lambda label: (-len(self.by_label[label]), label))[:200],
+            'authors': sorted(self.by_author, key=str.lower),
+        }
+
+
+class ReportRequestHandler(http.server.BaseHTTPRequestHandler):
+    """JSON API and viewer page; the index is attached to the server."""
+    
+    def _send(self, status, body, content_type):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _send_json(self, payload, status=200):
+        self._send(status, json.dumps(payload), 'application/json')
+    
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+        index = self.server.index
+        
+        try:
+            if url.path in ('/', '/index.html'):
+                self._send(200, self.server.page, 'text/html; charset=utf-8')
+            elif url.path == '/api/meta':
+                self._send_json(index.meta())
+            elif url.path == '/api/items':
+                page = max(1, int(params.get('page', 1)))
+                per_page = min(SERVE_MAX_PER_PAGE, max(1, int(params.get('per_page', self.server.per_page))))
+                total, items = index.page(self._query(index, params), page, per_page)
+                self._send_json({'total': total, 'page': page, 'per_page': per_page, 'items': items})
+            elif url.path == '/api/timeline':
+                bin_size = params.get('bin', 'week')
+                if bin_size not in ('day', 'week', 'month'):
+                    raise ValueError(f"unknown bin '{bin_size}'")
+                self._send_json({'bin': bin_size, 'bins': index.timeline(self._query(index, params), bin_size)})
+            else:
+                self._send_json({'error': 'not found'}, status=404)
+        except ValueError as e:
+            self._send_json({'error': str(e)}, status=400)
+    
+    @staticmethod
+    def _query(index, params):
+        return index.query(repo=params.get('repo'), item_type=params.get('type'), label=params.get('label'),
+                           author=params.get('author'), text=params.get('q'))
+    
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def serve_main(argv):
+    parser = argparse.ArgumentParser(prog='generate-report.py serve',
+                                     description='Serve loaded shipment data over a local JSON API')
+    parser.add_argument('--prs-json', help='JSON file with PR data')
+    parser.add_argument('--issues-json', help='JSON file with issues data')
+    parser.add_argument('--load-snapshot', help='Read items from a binary snapshot')
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=8082, help='Port to listen on')
+    parser.add_argument('--per-page', type=int, default=50, help='Default page size for /api/items')
+    parser.add_argument('--quiet', action='store_true', help='Do not log each request')
+    args = parser.parse_args(argv)
+    if args.load_snapshot and (args.prs_json or args.issues_json):
+        parser.error('--load-snapshot cannot be combined with --prs-json/--issues-json')
+    
+    started = time.perf_counter()
+    args.save_snapshot = None
+    all_items, items_by_repo, _ = load_dataset(args, parser)
+    index = ItemQueryIndex(all_items, items_by_repo)
+    print(f"📚 Indexed {len(all_items)} items in {time.perf_counter() - started:.2f}s")
+    
+    server = http.server.ThreadingHTTPServer((args.host, args.port), ReportRequestHandler)
+    server.daemon_threads = True
+    server.index = index
+    server.per_page = args.per_page
+    server.quiet = args.quiet
+    server.page = SERVE_TEMPLATE.format(head_assets=inline_assets()[0])
+    
+    print(f"Serving shipment data at http://{args.host}:{args.port}/")
+    print("Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def print_report_summary(output_path, stats):
+    print(f"✅ Report generated: {output_path}")
+    print(f"   {stats['total_items']} total items ({stats['total_prs']} PRs, {stats['total_issues']} issues)")
+    print(f"   {stats['total_contributors']} contributors")
+    print(f"   {stats['total_repos']} repositories")
+
+
+def main():
+    if sys.argv[1:2] == ['serve']:
+        serve_main(sys.argv[2:])
+        return
+    
+    parser = argparse.ArgumentParser(description='Generate shipment report HTML',
+                                     epilog='Run "generate-report.py serve --help" for the local report server.')
+    parser.add_argument('--repos', help='Comma-separated list of repos (required unless --batch)')
+    parser.add_argument('--since', help='Start date (YYYY-MM-DD) (required unless --batch)')
+    parser.add_argument('--until', help='End date (YYYY-MM-DD)', default=None)
+    parser.add_argument('--output', help='Output file (default: shipment-report.html)')
+    parser.add_argument('--prs-json', help='JSON file with PR data')
+    parser.add_argument('--issues-json', help='JSON file with issues data')
+    parser.add_argument('--cache-dir', default=default_cache_dir(), help='Directory for cached reports')
+    parser.add_argument('--cache-max-mb', type=float, default=256, help='Evict least-recently-used cache entries past this size')
+    parser.add_argument('--no-cache', action='store_true', help='Always regenerate and skip the cache')
+    parser.add_argument('--assets', choices=['inline', 'shared'], default='inline', help='Embed CSS/JS in the report or link to shared content-hashed files')
+    parser.add_argument('--assets-dir', help='Directory for shared assets (default: assets/ next to the output)')
+    parser.add_argument('--minify', action='store_true', help='Strip insignificant whitespace from the generated HTML')
+    parser.add_argument('--save-snapshot', help='Also write the normalized items to a binary snapshot file')
+    parser.add_argument('--load-snapshot', help='Read items from a binary snapshot instead of --prs-json/--issues-json')
+    parser.add_argument('--compress', type=parse_compress_formats, default=[], help='Also write precompressed siblings: gzip, br or gzip,br')
+    parser.add_argument('--batch', help='JSON config describing many reports to render from one load')
+    parser.add_argument('--jobs', type=int, help='Render batch reports in this many processes (default: config "jobs" or 1)')
+    parser.add_argument('--memory-budget', type=float, help='Stream items and spill per-repo item lists to sorted on-disk runs past this many MB')
+    
+    args = parser.parse_args()
+    if args.load_snapshot and (args.prs_json or args.issues_json):
+        parser.error('--load-snapshot cannot be combined with --prs-json/--issues-json')
+    
+    if args.batch:
+        # Report windows and outputs come from the config, and batch runs never use the cache
+        ignored = [flag for flag, value in (('--repos', args.repos), ('--since', args.since), ('--until', args.until),
+                                            ('--output', args.output), ('--no-cache', args.no_cache),
+                                            ('--memory-budget', args.memory_budget)) if value]
+        if ignored:
+            parser.error(f"{', '.join(ignored)} cannot be combined with --batch")
+        run_batch(args, parser)
+        return
+    if args.jobs:
+        parser.error('--jobs only applies to --batch')
+    if args.memory_budget is not None:
+        if args.memory_budget <= 0:
+            parser.error('--memory-budget must be a positive number of MB')
+        if args.save_snapshot:
+            parser.error('--save-snapshot needs every item in memory and cannot be combined with --memory-budget')
+    args.output = args.output or 'shipment-report.html'
+    if not args.repos or not args.since:
+        parser.error('--repos and --since are required unless --batch is given')
+    
+    repos = [r.strip() for r in args.repos.split(',')]
+    until_str = args.until or datetime.now().strftime('%Y-%m-%d')
+    
+    cache_key = None
+    if not args.no_cache:
+        cache_key = compute_cache_key(args, until_str, [args.prs_json, args.issues_json, args.load_snapshot])
+        # A snapshot can only be written from freshly loaded items
+        cached = None if args.save_snapshot else cache_lookup(args.cache_dir, cache_key)
+        if cached:
+            report_path, stats = cached
+            materialize_cached(report_path, args.output)
+            for message in finalize_output(args):
+                print(message)
+            print_report_summary(args.output, stats)
+            print(f"   ♻️  Cache hit ({cache_key[:12]})")
+            return
+    
+    assets = shared_assets(args.output, args.assets_dir) if args.assets == 'shared' else None
+    budget = SpillBudget(int(args.memory_budget * 1024 * 1024)) if args.memory_budget else None
+    try:
+        if budget:
+            summary, items_by_repo = load_dataset_budgeted(args, parser, budget)
+        else:
+            all_items, items_by_repo, _ = load_dataset(args, parser)
+            summary = summarize_items(all_items, items_by_repo)
+        write_report_streaming(args.output, summary, items_by_repo, repos, args.since, until_str,
+                               assets=assets, minify=args.minify)
+    except ValueError as e:
+        # Snapshot rows are only checked as they are read, which happens while rendering
+        parser.error(f'could not render report: {e}')
+    finally:
+        if budget:
+            budget.cleanup()
+    stats = compute_stats(summary, repos)
+    for message in finalize_output(args):
+        print(message)
+    
+    print_report_summary(args.output, stats)
+    
+    if cache_key:
+        try:
+            cache_store(args.cache_dir, cache_key, args.output, stats)
+            cache_evict(args.cache_dir, int(args.cache_max_mb * 1024 * 1024))
+            print(f"   💾 Cache miss ({cache_key[:12]}), stored")
+        except OSError as e:
+            print(f"   ⚠️  Cache miss ({cache_key[:12]}), could not store: {e}")
+    else:
+        print("   Cache disabled")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,23 @@
+#!/bin/bash
+# Serve shipment data through the local report server and open in browser
+#
+# Usage: serve.sh [PORT] --prs-json prs.json --issues-json issues.json
+#        serve.sh [PORT] --load-snapshot q1.snap
+
+PORT="8082"
+if [[ "$1" =~ ^[0-9]+$ ]]; then
+    PORT="$1"
+    shift
+fi
+DIR="$(dirname "$0")"
+
+if ! command -v python3 &>/dev/null; then
+    echo "Error: python3 is required to run the report server."
+    exit 1
+fi
+
+# Open browser after the data has had a moment to load
+(sleep 2 && open "http://localhost:$PORT/" 2>/dev/null || xdg-open "http://localhost:$PORT/" 2>/dev/null) &
+
+# Start the report server
+python3 "$DIR/generate-report.py" serve --port "$PORT" "$@"